@@ -39,6 +39,9 @@ from embedchain.vectordb.chroma import ChromaDB
 
 logger = logging.getLogger(__name__)
 
+# libyaml based loader is much faster than the pure python one, use it when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @register_deserializable
 class App(EmbedChain):
@@ -358,7 +361,7 @@ class App(EmbedChain):
             file_extension = os.path.splitext(config_path)[1]
             with open(config_path, "r", encoding="UTF-8") as file:
                 if file_extension in [".yaml", ".yml"]:
-                    config_data = yaml.safe_load(file)
+                    config_data = yaml.load(file, Loader=YAML_LOADER)
                 elif file_extension == ".json":
                     config_data = json.load(file)
                 else:
@@ -1,3 +1,10 @@
+import concurrent.futures
+import functools
+import logging
+import os
+import pickle
+from collections.abc import Callable
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional
 
 from langchain.text_splitter import RecursiveCharacterTextSplitter
@@ -7,6 +14,33 @@ from embedchain.config.add_config import ChunkerConfig
 from embedchain.helpers.json_serializable import register_deserializable
 
 
+logger = logging.getLogger(__name__)
+
+# With `parallel` enabled, documents longer than this (in characters) are split on multiple cores
+PARALLEL_CHUNKING_THRESHOLD = 200_000
+# Size of the segments (in characters) handed to each worker process
+PARALLEL_SEGMENT_SIZE = 50_000
+
+# Split between objects and lines first, then between members and key/value pairs, before falling back to words
+JSON_SEPARATORS = ["\n\n", "\n", ",", ":", " ", ""]
+# Max number of text splitters kept for reuse
+SPLITTER_CACHE_SIZE = 32
+
+
+# Text splitters are stateless, so chunkers with the same settings share one. The cache is bounded because callers may
+# pass a new `length_function` object every time.
+@functools.lru_cache(maxsize=SPLITTER_CACHE_SIZE)
+def _get_text_splitter(
+    chunk_size: int, chunk_overlap: int, length_function: Callable[[str], int]
+) -> RecursiveCharacterTextSplitter:
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=length_function,
+        separators=JSON_SEPARATORS,
+    )
+
+
 @register_deserializable
 class JSONChunker(BaseChunker):
     """Chunker for json."""
@@ -14,9 +48,44 @@ class JSONChunker(BaseChunker):
     def __init__(self, config: Optional[ChunkerConfig] = None):
         if config is None:
             config = ChunkerConfig(chunk_size=1000, chunk_overlap=0, length_function=len)
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=config.chunk_size,
-            chunk_overlap=config.chunk_overlap,
-            length_function=config.length_function,
-        )
+        text_splitter = _get_text_splitter(config.chunk_size, config.chunk_overlap, config.length_function)
         super().__init__(text_splitter)
+        self.parallel = getattr(config, "parallel", False)
+
+    def get_chunks(self, content):
+        """
+        Returns chunks using text splitter instance.
+
+        With `parallel` enabled in the chunker config, large documents are first cut into segments at line (or
+        member) boundaries, which are then split in parallel on multiple processes. Chunks never span two segments, so
+        they still respect `chunk_size`, but `chunk_overlap` is not applied across segment boundaries. Only enable it
+        when the calling program guards its entry point with `if __name__ == "__main__":`, worker processes re-import
+        it on platforms that spawn processes (macOS, Windows).
+        """
+        if not self.parallel or len(content) <= PARALLEL_CHUNKING_THRESHOLD or (os.cpu_count() or 1) == 1:
+            return super().get_chunks(content)
+
+        segments = self._split_segments(content, max(PARALLEL_SEGMENT_SIZE, self.text_splitter._chunk_size))
+        try:
+            with concurrent.futures.ProcessPoolExecutor() as executor:
+                return [chunk for chunks in executor.map(self.text_splitter.split_text, segments) for chunk in chunks]
+        except (BrokenProcessPool, pickle.PicklingError) as e:
+            # e.g. a custom `length_function` that can't be pickled
+            logger.warning(f"Parallel chunking failed, falling back to a single process: {e}")
+            return super().get_chunks(content)
+
+    @staticmethod
+    def _split_segments(content: str, segment_size: int) -> list[str]:
+        segments = []
+        start = 0
+        while len(content) - start > segment_size:
+            end = start + segment_size
+            cut = content.rfind("\n", start, end)
+            if cut <= start:
+                cut = content.rfind(",", start, end)
+            if cut <= start:
+                cut = end
+            segments.append(content[start:cut])
+            start = cut
+        segments.append(content[start:])
+        return segments
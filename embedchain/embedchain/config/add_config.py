@@ -20,10 +20,13 @@ class ChunkerConfig(BaseConfig):
         chunk_overlap: Optional[int] = 0,
         length_function: Optional[Callable[[str], int]] = None,
         min_chunk_size: Optional[int] = 0,
+        parallel: Optional[bool] = False,
     ):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
+        # Split large documents on multiple processes, only supported by chunkers that can split documents in segments
+        self.parallel = parallel
         if self.min_chunk_size >= self.chunk_size:
             raise ValueError(f"min_chunk_size {min_chunk_size} should be less than chunk_size {chunk_size}")
         if self.min_chunk_size < self.chunk_overlap:
@@ -15,6 +15,10 @@ class ChromaDbConfig(BaseVectorDbConfig):
         batch_size: Optional[int] = 100,
         allow_reset=False,
         chroma_settings: Optional[dict] = None,
+        hnsw_construction_ef: int = 200,
+        hnsw_search_ef: int = 100,
+        hnsw_m: int = 16,
+        hnsw_num_threads: Optional[int] = None,
     ):
         """
         Initializes a configuration class instance for ChromaDB.
@@ -33,9 +37,22 @@ class ChromaDbConfig(BaseVectorDbConfig):
         :type allow_reset: bool
         :param chroma_settings: Chroma settings dict, defaults to None
         :type chroma_settings: Optional[dict], optional
+        :param hnsw_construction_ef: Size of the candidate list used while building the HNSW index of new
+        collections, defaults to 200
+        :type hnsw_construction_ef: int, optional
+        :param hnsw_search_ef: Size of the candidate list used while querying the HNSW index, defaults to 100
+        :type hnsw_search_ef: int, optional
+        :param hnsw_m: Number of neighbours of each node in the HNSW graph of new collections, defaults to 16
+        :type hnsw_m: int, optional
+        :param hnsw_num_threads: Number of threads used to build the HNSW index, defaults to None (all CPUs)
+        :type hnsw_num_threads: Optional[int], optional
         """
 
         self.chroma_settings = chroma_settings
         self.allow_reset = allow_reset
         self.batch_size = batch_size
+        self.hnsw_construction_ef = hnsw_construction_ef
+        self.hnsw_search_ef = hnsw_search_ef
+        self.hnsw_m = hnsw_m
+        self.hnsw_num_threads = hnsw_num_threads
         super().__init__(collection_name=collection_name, dir=dir, host=host, port=port)
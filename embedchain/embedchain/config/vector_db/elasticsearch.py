@@ -14,6 +14,10 @@ class ElasticsearchDBConfig(BaseVectorDbConfig):
         es_url: Union[str, list[str]] = None,
         cloud_id: Optional[str] = None,
         batch_size: Optional[int] = 100,
+        hnsw_m: int = 16,
+        hnsw_ef_construction: int = 200,
+        num_candidates: Optional[int] = None,
+        quantization: Optional[str] = None,
         **ES_EXTRA_PARAMS: dict[str, any],
     ):
         """
@@ -29,9 +33,22 @@ class ElasticsearchDBConfig(BaseVectorDbConfig):
         :type cloud_id: Optional[str], optional
         :param batch_size: Number of items to insert in one batch, defaults to 100
         :type batch_size: Optional[int], optional
+        :param hnsw_m: Number of neighbors each node is connected to in the HNSW graph of a new index, defaults to 16
+        :type hnsw_m: int, optional
+        :param hnsw_ef_construction: Number of candidates considered while building the HNSW graph of a new index,
+        defaults to 200
+        :type hnsw_ef_construction: int, optional
+        :param num_candidates: Number of nearest neighbor candidates considered per shard at query time,
+        defaults to None (max(100, 4 * number of results))
+        :type num_candidates: Optional[int], optional
+        :param quantization: Set to "int8" to store the HNSW index of a new index as scalar quantized int8 vectors
+        (requires Elasticsearch 8.12+), defaults to None (float32)
+        :type quantization: Optional[str], optional
         :param ES_EXTRA_PARAMS: extra params dict that can be passed to elasticsearch.
         :type ES_EXTRA_PARAMS: dict[str, Any], optional
         """
+        if quantization not in (None, "int8"):
+            raise ValueError(f"Invalid quantization {quantization!r}. Only 'int8' is supported.")
         if es_url and cloud_id:
             raise ValueError("Only one of `es_url` and `cloud_id` can be set.")
         # self, es_url: Union[str, list[str]] = None, **ES_EXTRA_PARAMS: dict[str, any]):
@@ -53,4 +70,8 @@ class ElasticsearchDBConfig(BaseVectorDbConfig):
             self.ES_EXTRA_PARAMS["api_key"] = os.environ.get("ELASTICSEARCH_API_KEY")
 
         self.batch_size = batch_size
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.num_candidates = num_candidates
+        self.quantization = quantization
         super().__init__(collection_name=collection_name, dir=dir)
@@ -1,6 +1,8 @@
+import asyncio
 import hashlib
 import json
 import logging
+from collections.abc import Generator
 from typing import Any, Optional, Union
 
 from dotenv import load_dotenv
@@ -17,7 +19,7 @@ from embedchain.helpers.json_serializable import JSONSerializable
 from embedchain.llm.base import BaseLlm
 from embedchain.loaders.base_loader import BaseLoader
 from embedchain.models.data_type import DataType, DirectDataType, IndirectDataType, SpecialDataType
-from embedchain.utils.misc import detect_datatype, is_valid_json_string
+from embedchain.utils.misc import detect_datatype, is_valid_json_string, iterate_in_thread
 from embedchain.vectordb.base import BaseVectorDB
 
 load_dotenv()
@@ -661,6 +663,37 @@ class EmbedChain(JSONSerializable):
         )
         return answer
 
+    async def aquery(self, input_query: str, *args, **kwargs):
+        """
+        Async version of `query`, runs the query in a worker thread so the event loop is not blocked.
+
+        Takes the same arguments and returns the same result as `query`, except that a streamed answer is an async
+        generator of answer chunks.
+        """
+        result = await asyncio.to_thread(self.query, input_query, *args, **kwargs)
+        return self._to_async_answer(result)
+
+    async def achat(self, input_query: str, *args, **kwargs):
+        """
+        Async version of `chat`, runs the chat in a worker thread so the event loop is not blocked.
+
+        Takes the same arguments and returns the same result as `chat`, except that a streamed answer is an async
+        generator of answer chunks.
+        """
+        result = await asyncio.to_thread(self.chat, input_query, *args, **kwargs)
+        return self._to_async_answer(result)
+
+    @staticmethod
+    def _to_async_answer(result):
+        """Replace a streamed answer in a query or chat result with an async generator."""
+        if isinstance(result, Generator):
+            return iterate_in_thread(result)
+        if isinstance(result, tuple) and isinstance(result[0], Generator):
+            return (iterate_in_thread(result[0]), *result[1:])
+        if isinstance(result, dict) and isinstance(result.get("answer"), Generator):
+            return {**result, "answer": iterate_in_thread(result["answer"])}
+        return result
+
     def search(self, query, num_documents=3, where=None, raw_filter=None, namespace=None):
         """
         Search for similar documents related to the query in the vector database.
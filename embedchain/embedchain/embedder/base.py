@@ -1,3 +1,4 @@
+import functools
 from collections.abc import Callable
 from typing import Any, Optional
 
@@ -11,6 +12,9 @@ except RuntimeError:
     use_pysqlite3()
     from chromadb.api.types import Embeddable, EmbeddingFunction, Embeddings
 
+# Number of recent query embeddings kept per embedder
+QUERY_EMBEDDING_CACHE_SIZE = 1000
+
 
 class EmbeddingFunc(EmbeddingFunction):
     def __init__(self, embedding_fn: Callable[[list[str]], list[str]]):
@@ -52,6 +56,7 @@ class BaseEmbedder:
         if not hasattr(embedding_fn, "__call__"):
             raise ValueError("Embedding function is not a function")
         self.embedding_fn = embedding_fn
+        self._cached_query_embedding = functools.lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(self._query_embedding)
 
     def set_vector_dimension(self, vector_dimension: int):
         """
@@ -77,6 +82,29 @@ class BaseEmbedder:
 
         return EmbeddingFunc(embeddings.embed_documents)
 
+    def _query_embedding(self, query: str) -> tuple[float, ...]:
+        return tuple(self.embedding_fn([query])[0])
+
+    def embed_query(self, query: str) -> list[float]:
+        """
+        Convert a query to embeddings, reusing the embeddings of recently seen queries
+
+        :param query: query to convert to embeddings
+        :type query: str
+        :return: embeddings
+        :rtype: list[float]
+        """
+        return list(self._cached_query_embedding(query))
+
+    def query_cache_info(self) -> functools._CacheInfo:
+        """
+        Get hit and miss statistics of the query embedding cache
+
+        :return: cache statistics
+        :rtype: functools._CacheInfo
+        """
+        return self._cached_query_embedding.cache_info()
+
     def to_embeddings(self, data: str, **_):
         """
         Convert data to embeddings
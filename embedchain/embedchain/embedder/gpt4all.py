@@ -3,6 +3,7 @@ from typing import Optional
 from embedchain.config import BaseEmbedderConfig
 from embedchain.embedder.base import BaseEmbedder
 from embedchain.models import VectorDimensions
+from embedchain.utils.misc import get_cached_model
 
 
 class GPT4AllEmbedder(BaseEmbedder):
@@ -13,7 +14,10 @@ class GPT4AllEmbedder(BaseEmbedder):
 
         model_name = self.config.model or "all-MiniLM-L6-v2-f16.gguf"
         gpt4all_kwargs = {'allow_download': 'True'}
-        embeddings = LangchainGPT4AllEmbeddings(model_name=model_name, gpt4all_kwargs=gpt4all_kwargs)
+        embeddings = get_cached_model(
+            ("gpt4all", model_name),
+            lambda: LangchainGPT4AllEmbeddings(model_name=model_name, gpt4all_kwargs=gpt4all_kwargs),
+        )
         embedding_fn = BaseEmbedder._langchain_default_concept(embeddings)
         self.set_embedding_fn(embedding_fn=embedding_fn)
 
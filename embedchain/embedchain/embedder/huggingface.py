@@ -1,5 +1,7 @@
+import json
 import os
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional, Union
 
 from langchain_community.embeddings import HuggingFaceEmbeddings
 
@@ -14,6 +16,13 @@ except ModuleNotFoundError:
 from embedchain.config import BaseEmbedderConfig
 from embedchain.embedder.base import BaseEmbedder
 from embedchain.models import VectorDimensions
+from embedchain.utils.misc import get_cached_model
+
+# Small and fast model, matches `VectorDimensions.HUGGING_FACE`
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+ONNX_CACHE_DIR = os.path.join(Path.home(), ".cache", "embedchain", "onnx")
+# Number of texts encoded per forward pass of local models
+ENCODE_BATCH_SIZE = 64
 
 
 class HuggingFaceEmbedder(BaseEmbedder):
@@ -31,10 +40,72 @@ class HuggingFaceEmbedder(BaseEmbedder):
                 huggingfacehub_api_token=self.config.api_key or os.getenv("HUGGINGFACE_ACCESS_TOKEN"),
             )
         else:
-            embeddings = HuggingFaceEmbeddings(model_name=self.config.model, model_kwargs=self.config.model_kwargs)
+            if self.config.model is None:
+                self.config.model = DEFAULT_MODEL
+            model_kwargs_key = json.dumps(self.config.model_kwargs, sort_keys=True, default=str)
+            embeddings = get_cached_model(
+                ("huggingface", self.config.model, model_kwargs_key),
+                lambda: HuggingFaceEmbedder._get_local_embeddings(self.config.model, self.config.model_kwargs),
+            )
 
         embedding_fn = BaseEmbedder._langchain_default_concept(embeddings)
         self.set_embedding_fn(embedding_fn=embedding_fn)
 
         vector_dimension = self.config.vector_dimension or VectorDimensions.HUGGING_FACE.value
         self.set_vector_dimension(vector_dimension=vector_dimension)
+
+    @staticmethod
+    def _get_local_embeddings(model: str, model_kwargs: dict[str, Any]) -> HuggingFaceEmbeddings:
+        """
+        Load a local sentence transformers model.
+
+        Setting `backend: onnx` in `model_kwargs` runs the model with ONNX Runtime instead of PyTorch, which is
+        considerably faster on CPU. Setting `quantize` additionally exports an INT8 dynamically quantized copy of the
+        model (cached under `~/.cache/embedchain/onnx`) and loads that instead. `encode_kwargs` in `model_kwargs` are
+        passed to `SentenceTransformer.encode`, texts are encoded in batches of `ENCODE_BATCH_SIZE` by default.
+
+        :param model: name or path of the sentence transformers model
+        :type model: str
+        :param model_kwargs: key-value arguments for `SentenceTransformer`
+        :type model_kwargs: dict[str, Any]
+        :return: langchain embeddings
+        :rtype: HuggingFaceEmbeddings
+        """
+        model_kwargs = dict(model_kwargs)
+        quantize = model_kwargs.pop("quantize", False)
+        encode_kwargs = {"batch_size": ENCODE_BATCH_SIZE, **model_kwargs.pop("encode_kwargs", {})}
+        if quantize:
+            model, file_name = HuggingFaceEmbedder._export_quantized_onnx_model(model, quantize)
+            model_kwargs["backend"] = "onnx"
+            model_kwargs["model_kwargs"] = {**model_kwargs.get("model_kwargs", {}), "file_name": file_name}
+        return HuggingFaceEmbeddings(model_name=model, model_kwargs=model_kwargs, encode_kwargs=encode_kwargs)
+
+    @staticmethod
+    def _export_quantized_onnx_model(model: str, quantize: Union[bool, str]) -> tuple[str, str]:
+        """
+        Export an INT8 dynamically quantized ONNX copy of the model, unless it has been exported before.
+
+        :param model: name or path of the sentence transformers model
+        :type model: str
+        :param quantize: `True` or the ONNX Runtime quantization config to use (`arm64`, `avx2`, `avx512` or
+        `avx512_vnni`), `True` means `avx512_vnni`
+        :type quantize: Union[bool, str]
+        :return: directory of the exported model and the ONNX file name inside it
+        :rtype: tuple[str, str]
+        """
+        try:
+            from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+        except ImportError:
+            raise ImportError(
+                "Quantized ONNX embeddings require sentence-transformers>=3.2 with ONNX support. "
+                "Please install with `pip install --upgrade 'sentence-transformers[onnx]'`"
+            ) from None
+
+        quantization_config = "avx512_vnni" if quantize is True else quantize
+        save_dir = os.path.join(ONNX_CACHE_DIR, model.replace("/", "--"))
+        file_name = f"onnx/model_qint8_{quantization_config}.onnx"
+        if not os.path.exists(os.path.join(save_dir, file_name)):
+            onnx_model = SentenceTransformer(model, backend="onnx")
+            onnx_model.save(save_dir)
+            export_dynamic_quantized_onnx_model(onnx_model, quantization_config, save_dir)
+        return save_dir, file_name
@@ -1,9 +1,6 @@
 import os
 from typing import Optional
 
-from chromadb.utils.embedding_functions import OpenAIEmbeddingFunction
-
-
 from embedchain.config import BaseEmbedderConfig
 from embedchain.embedder.base import BaseEmbedder
 from embedchain.models import VectorDimensions
@@ -21,6 +18,10 @@ class OpenAIEmbedder(BaseEmbedder):
 
         if api_key is None and os.getenv("OPENAI_ORGANIZATION") is None:
             raise ValueError("OPENAI_API_KEY or OPENAI_ORGANIZATION environment variables not provided")  # noqa:E501
+
+        # chromadb's embedding functions module is only needed once an OpenAI embedder is created
+        from chromadb.utils.embedding_functions import OpenAIEmbeddingFunction
+
         embedding_fn = OpenAIEmbeddingFunction(
             api_key=api_key,
             api_base=api_base,
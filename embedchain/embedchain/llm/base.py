@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any, Optional
 
 from langchain.schema import BaseMessage as LCBaseMessage
@@ -14,6 +15,7 @@ from embedchain.config.llm.base import (
 from embedchain.helpers.json_serializable import JSONSerializable
 from embedchain.memory.base import ChatHistory
 from embedchain.memory.message import ChatMessage
+from embedchain.utils.misc import iterate_in_thread
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +42,29 @@ class BaseLlm(JSONSerializable):
         """
         raise NotImplementedError
 
+    async def aget_llm_model_answer(self, prompt: str) -> AsyncGenerator[str, None]:
+        """
+        Get the answer for a prompt without blocking the event loop.
+
+        The answer is generated in a worker thread. Streamed answers (`stream: true`) are yielded chunk by chunk as
+        the LLM produces them, other answers are yielded at once.
+
+        :param prompt: The prompt to pass to the LLM.
+        :type prompt: str
+        :yield: Answer chunks
+        :rtype: AsyncGenerator[str, None]
+        """
+        answer = await asyncio.to_thread(self.get_llm_model_answer, prompt)
+        if isinstance(answer, tuple):
+            # Answer with token usage info
+            answer = answer[0]
+        if isinstance(answer, str):
+            yield answer
+            return
+
+        async for chunk in iterate_in_thread(answer):
+            yield chunk
+
     def set_history(self, history: Any):
         """
         Provide your own history.
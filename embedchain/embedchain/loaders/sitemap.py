@@ -1,26 +1,38 @@
 import concurrent.futures
 import hashlib
+import itertools
 import logging
 import os
+import sys
+from typing import Optional
 from urllib.parse import urlparse
 
 import requests
 from tqdm import tqdm
 
 try:
-    from bs4 import BeautifulSoup
     from bs4.builder import ParserRejectedMarkup
+    from lxml import etree
 except ImportError:
     raise ImportError(
-        "Sitemap requires extra dependencies. Install with `pip install beautifulsoup4==4.12.3`"
+        "Sitemap requires extra dependencies. Install with `pip install beautifulsoup4==4.12.3 lxml`"
     ) from None
 
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.loaders.base_loader import BaseLoader
-from embedchain.loaders.web_page import WebPageLoader
+from embedchain.loaders.web_page import POOL_SIZE, WebPageLoader
 
 logger = logging.getLogger(__name__)
 
+# Sitemap entries with these extensions are files rather than web pages and are not loaded
+NON_HTML_EXTENSIONS = (".pdf", ".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".mp3", ".mp4", ".zip", ".gz")
+
+# Page loads are network bound, so use more threads than cores, up to the size of the connection pool
+DEFAULT_MAX_WORKERS = min(POOL_SIZE, 4 * (os.cpu_count() or 1))
+
+# Above this many pages the progress bar is only shown on a terminal, logging it elsewhere is mostly overhead
+PROGRESS_BAR_MAX_PAGES = 10_000
+
 
 @register_deserializable
 class SitemapLoader(BaseLoader):
@@ -30,8 +42,8 @@ class SitemapLoader(BaseLoader):
     of each page.
     """
 
-    def load_data(self, sitemap_source):
-        output = []
+    def load_data(self, sitemap_source, max_workers: Optional[int] = None):
+        # All page loads share one pooled session, so connections are kept alive between pages of the same site
         web_page_loader = WebPageLoader()
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36",  # noqa:E501
@@ -39,23 +51,30 @@ class SitemapLoader(BaseLoader):
 
         if urlparse(sitemap_source).scheme in ("http", "https"):
             try:
-                response = requests.get(sitemap_source, headers=headers)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, "xml")
+                with web_page_loader._session.get(sitemap_source, headers=headers, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    links = self._parse_links(response.raw)
             except requests.RequestException as e:
                 logger.error(f"Error fetching sitemap from URL: {e}")
                 return
         elif os.path.isfile(sitemap_source):
-            with open(sitemap_source, "r") as file:
-                soup = BeautifulSoup(file, "xml")
+            links = self._parse_links(sitemap_source)
         else:
             raise ValueError("Invalid sitemap source. Please provide a valid URL or local file path.")
 
-        links = [link.text for link in soup.find_all("loc") if link.parent.name == "url"]
-        if len(links) == 0:
-            links = [link.text for link in soup.find_all("loc")]
+        # Sitemaps often list the same page more than once, only load it once
+        links = list(dict.fromkeys(links))
 
-        doc_id = hashlib.sha256((" ".join(links) + sitemap_source).encode()).hexdigest()
+        # Hash incrementally to avoid building one large string of all links. Same digest as
+        # `sha256((" ".join(links) + sitemap_source).encode())`.
+        hasher = hashlib.sha256()
+        for i, link in enumerate(links):
+            if i:
+                hasher.update(b" ")
+            hasher.update(link.encode())
+        hasher.update(sitemap_source.encode())
+        doc_id = hasher.hexdigest()
 
         def load_web_page(link):
             try:
@@ -65,15 +84,56 @@ class SitemapLoader(BaseLoader):
                 logger.error(f"Failed to parse {link}: {e}")
             return None
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_to_link = {executor.submit(load_web_page, link): link for link in links}
-            for future in tqdm(concurrent.futures.as_completed(future_to_link), total=len(links), desc="Loading pages"):
-                link = future_to_link[future]
+        page_links = [link for link in links if not urlparse(link).path.lower().endswith(NON_HTML_EXTENSIONS)]
+        if len(page_links) < len(links):
+            logger.info(f"Skipping {len(links) - len(page_links)} links to files that are not web pages")
+
+        # Results are stored by link position, so the output follows the sitemap order whatever order pages finish in
+        results = [None] * len(page_links)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or DEFAULT_MAX_WORKERS) as executor:
+            future_to_index = {executor.submit(load_web_page, link): i for i, link in enumerate(page_links)}
+            for future in tqdm(
+                concurrent.futures.as_completed(future_to_index),
+                total=len(page_links),
+                desc="Loading pages",
+                mininterval=0.5,
+                miniters=max(1, len(page_links) // 200),
+                disable=len(page_links) > PROGRESS_BAR_MAX_PAGES and not sys.stderr.isatty(),
+            ):
+                index = future_to_index[future]
                 try:
-                    data = future.result()
-                    if data:
-                        output.extend(data)
+                    results[index] = future.result()
                 except Exception as e:
-                    logger.error(f"Error loading page {link}: {e}")
+                    logger.error(f"Error loading page {page_links[index]}: {e}")
 
+        output = list(itertools.chain.from_iterable(data for data in results if data))
         return {"doc_id": doc_id, "data": output}
+
+    @staticmethod
+    def _parse_links(source) -> list[str]:
+        """
+        Stream the sitemap and collect the page urls.
+
+        Only `<loc>` elements inside `<url>` are page urls. If there are none, e.g. for a sitemap index, all `<loc>`
+        elements are returned.
+
+        :param source: file path or file-like object with the sitemap xml
+        :return: list of urls, empty if the sitemap could not be parsed
+        :rtype: list[str]
+        """
+        page_links, all_links = [], []
+        # Recover from malformed sitemaps like the previous BeautifulSoup parser did, and never fetch external entities
+        elements = etree.iterparse(
+            source, events=("end",), tag="{*}loc", recover=True, resolve_entities=False, no_network=True
+        )
+        try:
+            for _, element in elements:
+                link = element.text or ""
+                all_links.append(link)
+                if etree.QName(element.getparent()).localname == "url":
+                    page_links.append(link)
+                element.clear()
+        except etree.XMLSyntaxError as e:
+            # Raised even in recover mode if the content is not xml at all, e.g. an html error page
+            logger.error(f"Error parsing sitemap: {e}")
+        return page_links or all_links
@@ -1,7 +1,10 @@
 import hashlib
 import logging
+from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from bs4 import BeautifulSoup
@@ -16,11 +19,34 @@ from embedchain.utils.misc import clean_string
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of keep-alive connections per host, sized for concurrent page loads (e.g. sitemaps)
+POOL_SIZE = 32
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 @register_deserializable
 class WebPageLoader(BaseLoader):
     # Shared session for all instances
-    _session = requests.Session()
+    _session = _create_session()
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the web page loader.
+
+        :param session: requests session to load pages with, defaults to the session shared by all instances
+        :type session: Optional[requests.Session], optional
+        """
+        super().__init__()
+        if session is not None:
+            self._session = session
 
     def load_data(self, url):
         """Load data from a web page using a shared requests' session."""
@@ -47,7 +73,8 @@ class WebPageLoader(BaseLoader):
 
     @staticmethod
     def _get_clean_content(html, url) -> str:
-        soup = BeautifulSoup(html, "html.parser")
+        # lxml's C parser is several times faster than python's built-in html parser
+        soup = BeautifulSoup(html, "lxml")
         original_size = len(str(soup.get_text()))
 
         tags_to_exclude = [
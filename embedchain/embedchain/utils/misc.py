@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import itertools
 import json
@@ -5,6 +6,8 @@ import logging
 import os
 import re
 import string
+import threading
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable
 from typing import Any
 
 from schema import Optional, Or, Schema
@@ -14,6 +17,9 @@ from embedchain.models.data_type import DataType
 
 logger = logging.getLogger(__name__)
 
+_model_cache: dict[Hashable, Any] = {}
+_model_cache_lock = threading.Lock()
+
 
 def parse_content(content, type):
     implemented = ["html.parser", "lxml", "lxml-xml", "xml", "html5lib"]
@@ -508,6 +514,7 @@ def validate_config(config_data):
                 Optional("chunk_overlap"): int,
                 Optional("length_function"): str,
                 Optional("min_chunk_size"): int,
+                Optional("parallel"): bool,
             },
             Optional("cache"): {
                 Optional("similarity_evaluation"): {
@@ -540,3 +547,71 @@ def chunks(iterable, batch_size=100, desc="Processing chunks"):
             yield chunk
             pbar.update(len(chunk))
             chunk = tuple(itertools.islice(it, batch_size))
+
+
+def get_cached_model(key: Hashable, loader: Callable[[], Any]) -> Any:
+    """
+    Return the model cached under `key`, calling `loader` to create it on the first request.
+
+    Loading local models (sentence transformers, GPT4All weights) takes seconds and hundreds of MB of memory,
+    so apps created with the same model share a single instance for the lifetime of the process.
+
+    :param key: cache key, usually the provider and model name
+    :type key: Hashable
+    :param loader: function that loads the model
+    :type loader: Callable[[], Any]
+    :return: the cached model
+    :rtype: Any
+    """
+    model = _model_cache.get(key)
+    if model is None:
+        with _model_cache_lock:
+            model = _model_cache.get(key)
+            if model is None:
+                model = loader()
+                _model_cache[key] = model
+    return model
+
+
+def clear_model_cache():
+    """
+    Remove all models loaded with `get_cached_model`.
+    """
+    with _model_cache_lock:
+        _model_cache.clear()
+
+
+async def iterate_in_thread(iterable: Iterable) -> AsyncIterator:
+    """
+    Iterate over a blocking iterable in a worker thread and yield its items on the event loop.
+
+    One thread consumes the whole iterable and hands each item to the loop through a queue, so a streamed answer
+    costs one thread for the whole stream instead of a thread pool round trip per item.
+
+    :param iterable: iterable whose iteration blocks, e.g. a streamed LLM answer
+    :type iterable: Iterable
+    :yield: the items of the iterable
+    :rtype: AsyncIterator
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    done = object()
+
+    def produce():
+        try:
+            for item in iterable:
+                loop.call_soon_threadsafe(queue.put_nowait, (item, None))
+        except BaseException as e:
+            loop.call_soon_threadsafe(queue.put_nowait, (done, e))
+        else:
+            loop.call_soon_threadsafe(queue.put_nowait, (done, None))
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    while True:
+        item, error = await queue.get()
+        if error is not None:
+            raise error
+        if item is done:
+            break
+        yield item
@@ -1,4 +1,5 @@
 import logging
+import os
 from typing import Any, Optional, Union
 
 from chromadb import Collection, QueryResult
@@ -103,12 +104,32 @@ class ChromaDB(BaseVectorDB):
         """
         if not hasattr(self, "embedder") or not self.embedder:
             raise ValueError("Cannot create a Chroma database collection without an embedder.")
-        self.collection = self.client.get_or_create_collection(
-            name=name,
-            embedding_function=self.embedder.embedding_fn,
-        )
+        # get_or_create_collection replaces the metadata of an existing collection, so it is only passed when creating
+        # the collection and existing collections keep their HNSW parameters and other metadata.
+        if name in {collection.name for collection in self.client.list_collections()}:
+            self.collection = self.client.get_collection(name=name, embedding_function=self.embedder.embedding_fn)
+        else:
+            self.collection = self.client.get_or_create_collection(
+                name=name,
+                embedding_function=self.embedder.embedding_fn,
+                metadata=self._get_collection_metadata(),
+            )
         return self.collection
 
+    def _get_collection_metadata(self) -> dict[str, int]:
+        """
+        HNSW index parameters of new collections.
+
+        :return: Collection metadata
+        :rtype: dict[str, int]
+        """
+        return {
+            "hnsw:construction_ef": self.config.hnsw_construction_ef,
+            "hnsw:search_ef": self.config.hnsw_search_ef,
+            "hnsw:M": self.config.hnsw_m,
+            "hnsw:num_threads": self.config.hnsw_num_threads or os.cpu_count() or 1,
+        }
+
     def get(self, ids: Optional[list[str]] = None, where: Optional[dict[str, any]] = None, limit: Optional[int] = None):
         """
         Get existing doc ids present in vector database
@@ -217,10 +238,9 @@ class ChromaDB(BaseVectorDB):
         if where:
             where_clause = self._generate_where_clause(where)
         try:
+            # Embed the query through the embedder so repeated queries hit its query embedding cache
             result = self.collection.query(
-                query_texts=[
-                    input_query,
-                ],
+                query_embeddings=[self.embedder.embed_query(input_query)],
                 n_results=n_results,
                 where=where_clause,
             )
@@ -3,12 +3,18 @@ from typing import Any, Optional, Union
 
 try:
     from elasticsearch import Elasticsearch
-    from elasticsearch.helpers import bulk
+    from elasticsearch.helpers import streaming_bulk
+    from elasticsearch.serializer import JSONSerializer
 except ImportError:
     raise ImportError(
         "Elasticsearch requires extra dependencies. Install with `pip install --upgrade embedchain[elasticsearch]`"
     ) from None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from embedchain.config import ElasticsearchDBConfig
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.utils.misc import chunks
@@ -17,6 +23,18 @@ from embedchain.vectordb.base import BaseVectorDB
 logger = logging.getLogger(__name__)
 
 
+class OrjsonSerializer(JSONSerializer):
+    """JSON serializer using orjson, which encodes the float lists of embeddings much faster than `json`."""
+
+    def dumps(self, data: Any) -> Any:
+        if isinstance(data, (str, bytes)):
+            return super().dumps(data)
+        return orjson.dumps(data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def loads(self, data: Any) -> Any:
+        return orjson.loads(data)
+
+
 @register_deserializable
 class ElasticsearchDB(BaseVectorDB):
     """
@@ -46,10 +64,13 @@ class ElasticsearchDB(BaseVectorDB):
                     "Please make sure the type is right and that you are passing an instance."
                 )
             self.config = config or es_config
+        es_params = dict(self.config.ES_EXTRA_PARAMS)
+        if orjson is not None:
+            es_params.setdefault("serializer", OrjsonSerializer())
         if self.config.ES_URL:
-            self.client = Elasticsearch(self.config.ES_URL, **self.config.ES_EXTRA_PARAMS)
+            self.client = Elasticsearch(self.config.ES_URL, **es_params)
         elif self.config.CLOUD_ID:
-            self.client = Elasticsearch(cloud_id=self.config.CLOUD_ID, **self.config.ES_EXTRA_PARAMS)
+            self.client = Elasticsearch(cloud_id=self.config.CLOUD_ID, **es_params)
         else:
             raise ValueError(
                 "Something is wrong with your config. Please check again - `https://docs.embedchain.ai/components/vector-databases#elasticsearch`"  # noqa: E501
@@ -68,7 +89,18 @@ class ElasticsearchDB(BaseVectorDB):
             "mappings": {
                 "properties": {
                     "text": {"type": "text"},
-                    "embeddings": {"type": "dense_vector", "index": False, "dims": self.embedder.vector_dimension},
+                    "embeddings": {
+                        "type": "dense_vector",
+                        "dims": self.embedder.vector_dimension,
+                        "index": True,
+                        "similarity": "cosine",
+                        "index_options": {
+                            # Elasticsearch quantizes the vectors of `int8_hnsw` indices to int8 itself
+                            "type": "int8_hnsw" if self.config.quantization == "int8" else "hnsw",
+                            "m": self.config.hnsw_m,
+                            "ef_construction": self.config.hnsw_ef_construction,
+                        },
+                    },
                 }
             }
         }
@@ -77,6 +109,13 @@ class ElasticsearchDB(BaseVectorDB):
             # create index if not exist
             print("Creating index", es_index, index_settings)
             self.client.indices.create(index=es_index, body=index_settings)
+            self.knn_enabled = True
+        else:
+            # Indices created by older versions store embeddings without an HNSW index and can't use kNN search
+            # An index without an embeddings mapping yet (e.g. created empty outside embedchain) uses script_score
+            mapping = self.client.indices.get_mapping(index=es_index)[es_index]["mappings"]
+            embeddings_mapping = mapping.get("properties", {}).get("embeddings")
+            self.knn_enabled = bool(embeddings_mapping and embeddings_mapping.get("index", True))
 
     def _get_or_create_db(self):
         """Called during initialization"""
@@ -136,30 +175,24 @@ class ElasticsearchDB(BaseVectorDB):
         :type ids: list[str]
         """
 
-        embeddings = self.embedder.embedding_fn(documents)
-
-        for chunk in chunks(
-            list(zip(ids, documents, metadatas, embeddings)),
-            self.batch_size,
-            desc="Inserting batches in elasticsearch",
-        ):  # noqa: E501
-            ids, docs, metadatas, embeddings = [], [], [], []
-            for id, text, metadata, embedding in chunk:
-                ids.append(id)
-                docs.append(text)
-                metadatas.append(metadata)
-                embeddings.append(embedding)
-
-            batch_docs = []
-            for id, text, metadata, embedding in zip(ids, docs, metadatas, embeddings):
-                batch_docs.append(
-                    {
+        def generate_actions():
+            # Embed one batch at a time so that only a batch worth of embeddings is held in memory
+            for chunk in chunks(
+                list(zip(ids, documents, metadatas)),
+                self.batch_size,
+                desc="Inserting batches in elasticsearch",
+            ):
+                batch_ids, batch_docs, batch_metadatas = zip(*chunk)
+                embeddings = self.embedder.embedding_fn(list(batch_docs))
+                for id, text, metadata, embedding in zip(batch_ids, batch_docs, batch_metadatas, embeddings):
+                    yield {
                         "_index": self._get_index(),
                         "_id": id,
                         "_source": {"text": text, "metadata": metadata, "embeddings": embedding},
                     }
-                )
-            bulk(self.client, batch_docs, **kwargs)
+
+        for _ in streaming_bulk(self.client, generate_actions(), chunk_size=self.batch_size, **kwargs):
+            pass
         self.client.indices.refresh(index=self._get_index())
 
     def query(
@@ -186,33 +219,44 @@ class ElasticsearchDB(BaseVectorDB):
         along with url of the source and doc_id (if citations flag is true)
         :rtype: list[str], if citations=False, otherwise list[tuple[str, str, str]]
         """
-        input_query_vector = self.embedder.embedding_fn([input_query])
-        query_vector = input_query_vector[0]
-
-        # `https://www.elastic.co/guide/en/elasticsearch/reference/7.17/query-dsl-script-score-query.html`
-        query = {
-            "script_score": {
-                "query": {"bool": {"must": [{"exists": {"field": "text"}}]}},
-                "script": {
-                    "source": "cosineSimilarity(params.input_query_vector, 'embeddings') + 1.0",
-                    "params": {"input_query_vector": query_vector},
-                },
-            }
-        }
-
-        if where:
-            for key, value in where.items():
-                query["script_score"]["query"]["bool"]["must"].append({"term": {f"metadata.{key}.keyword": value}})
+        query_vector = self.embedder.embed_query(input_query)
 
         _source = ["text", "metadata"]
-        response = self.client.search(index=self._get_index(), query=query, _source=_source, size=n_results)
+        filters = [{"term": {f"metadata.{key}.keyword": value}} for key, value in (where or {}).items()]
+        if self.knn_enabled:
+            # Approximate nearest neighbor search on the HNSW index
+            # `https://www.elastic.co/guide/en/elasticsearch/reference/current/knn-search.html`
+            num_candidates = self.config.num_candidates or max(100, 4 * n_results)
+            knn = {
+                "field": "embeddings",
+                "query_vector": query_vector,
+                "k": n_results,
+                "num_candidates": max(num_candidates, n_results),
+            }
+            if filters:
+                knn["filter"] = {"bool": {"must": filters}}
+            response = self.client.search(index=self._get_index(), knn=knn, _source=_source, size=n_results)
+        else:
+            # `https://www.elastic.co/guide/en/elasticsearch/reference/7.17/query-dsl-script-score-query.html`
+            query = {
+                "script_score": {
+                    "query": {"bool": {"must": [{"exists": {"field": "text"}}, *filters]}},
+                    "script": {
+                        "source": "cosineSimilarity(params.input_query_vector, 'embeddings') + 1.0",
+                        "params": {"input_query_vector": query_vector},
+                    },
+                }
+            }
+            response = self.client.search(index=self._get_index(), query=query, _source=_source, size=n_results)
         docs = response["hits"]["hits"]
         contexts = []
         for doc in docs:
             context = doc["_source"]["text"]
             if citations:
                 metadata = doc["_source"]["metadata"]
-                metadata["score"] = doc["_score"]
+                # kNN cosine scores are `(1 + cosine) / 2`, scale them to the `cosine + 1` of script_score so scores
+                # keep the same range whichever search is used
+                metadata["score"] = 2 * doc["_score"] if self.knn_enabled else doc["_score"]
                 contexts.append(tuple((context, metadata)))
             else:
                 contexts.append(context)
@@ -29,7 +29,7 @@ async def on_chat_start():
 async def on_message(message: cl.Message):
     app = cl.user_session.get("app")
     msg = cl.Message(content="")
-    for chunk in await cl.make_async(app.chat)(message.content):
+    async for chunk in await app.achat(message.content):
         await msg.stream_token(chunk)
 
     await msg.send()
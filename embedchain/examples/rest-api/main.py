@@ -1,13 +1,27 @@
 import logging
 import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+from typing import Optional
 
 import aiofiles
+import anyio
+import metrics
 import yaml
 from database import Base, SessionLocal, engine
-from fastapi import Depends, FastAPI, HTTPException, UploadFile
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from models import DefaultResponse, DeployAppRequest, QueryApp, SourceApp
 from services import get_app, get_apps, remove_app, save_app
 from sqlalchemy.orm import Session
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Receive, Scope, Send
 from utils import generate_error_message_for_api_keys
 
 from embedchain import App
@@ -15,9 +29,129 @@ from embedchain.client import Client
 
 logger = logging.getLogger(__name__)
 
+# libyaml based loader is much faster than the pure python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", None)
+if YAML_LOADER is None:
+    logger.warning("PyYAML was built without libyaml, parsing config files will be slow. Please install libyaml.")
+    YAML_LOADER = yaml.SafeLoader
+
 Base.metadata.create_all(bind=engine)
 
 
+APP_ID_NOT_PROVIDED = "App ID not provided. If you want to use the default app, use 'default' as the app_id."
+APP_NOT_FOUND = "App with id {app_id} does not exist, please create it first."
+# Health checks hit `/ping` often, so its response is serialized once
+PONG_RESPONSE = b'{"ping":"pong"}'
+
+# Max number of blocking app calls (LLM, vector database, ...) that run at the same time
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "40"))
+
+# Uploaded config files are stored in this directory, named after the app ID
+CONFIG_DIR = Path("configs")
+CONFIG_DIR.mkdir(exist_ok=True)
+# App IDs are used as file names, so only allow characters that are safe in a path
+APP_ID_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+# Uploaded config files are written to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Max number of loaded apps kept in memory. A cached app is used by concurrent requests, LLMs that are not thread safe
+# (like GPT4All) serialize generation themselves.
+APP_CACHE_SIZE = 256
+# Loaded apps by config path and modification time, least recently used first
+app_cache: OrderedDict[tuple[str, float], App] = OrderedDict()
+# Locks held while loading an app, so that each config is only loaded once
+app_load_locks: dict[tuple[str, float], threading.Lock] = {}
+# Guards `app_cache` and `app_load_locks`, it is never held while an app is loading
+app_cache_lock = threading.Lock()
+
+
+def _get_cached_app(key: tuple[str, float]) -> Optional[App]:
+    with app_cache_lock:
+        app = app_cache.get(key)
+        if app is not None:
+            app_cache.move_to_end(key)
+        return app
+
+
+def _load_app(config_path: str) -> App:
+    """
+    Get the app for a config file from the cache, it is loaded again when the file has changed.
+    """
+    key = (config_path, os.path.getmtime(config_path))
+    app = _get_cached_app(key)
+    if app is not None:
+        return app
+
+    with app_cache_lock:
+        load_lock = app_load_locks.setdefault(key, threading.Lock())
+    with load_lock:
+        # Another request may have loaded the app while this one was waiting
+        app = _get_cached_app(key)
+        if app is not None:
+            return app
+        try:
+            app = App.from_config(config_path=config_path)
+        except Exception:
+            with app_cache_lock:
+                app_load_locks.pop(key, None)
+            raise
+        with app_cache_lock:
+            app_cache[key] = app
+            if len(app_cache) > APP_CACHE_SIZE:
+                app_cache.popitem(last=False)
+            app_load_locks.pop(key, None)
+    return app
+
+
+def _evict_app(config_path: str):
+    with app_cache_lock:
+        for key in [key for key in app_cache if key[0] == config_path]:
+            del app_cache[key]
+
+
+def _read_app_config(config_path: str) -> tuple[tuple[str, float], dict]:
+    """
+    Get the cache key and the parsed config of an app's config file.
+    """
+    key = (config_path, os.path.getmtime(config_path))
+    return key, _load_yaml_file(config_path)
+
+
+def _delete_app_data(app_id: str, key: tuple[str, float], config: dict):
+    """
+    Reset the vector database of an app, then remove the app.
+
+    The database is reset with the config read when the delete was requested, so an app created again with the same
+    ID is not reset. The app is kept when the reset fails, so that its data is not orphaned and deleting it can be
+    retried.
+    """
+    config_path = key[0]
+    try:
+        app = _get_cached_app(key) or App.from_config(config=config)
+        app.db.reset()
+    except Exception as e:
+        logger.warning(f"Error resetting database of app {app_id}, the app is not deleted: {e}")
+        return
+    finally:
+        _evict_app(config_path)
+
+    db = SessionLocal()
+    try:
+        db_app = get_app(db, app_id)
+        if db_app is not None and db_app.config == config_path:
+            remove_app(db, db_app)
+    finally:
+        db.close()
+
+
+def _load_yaml_file(path: str):
+    # Parse the bytes without decoding them to a string first. Errors then name the input `<byte string>`, not the
+    # file, so server paths are not sent back to clients.
+    with open(path, "rb") as file:
+        return yaml.load(file.read(), Loader=YAML_LOADER)
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -26,7 +160,19 @@ def get_db():
         db.close()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+    if metrics.METRICS_ENABLED:
+        metrics.mark_process_dead()
+
+
 app = FastAPI(
+    lifespan=lifespan,
+    # Handlers return `ORJSONResponse` directly, this skips validating the response against `response_model`,
+    # which is then only used to document the response.
+    default_response_class=ORJSONResponse,
     title="Embedchain REST API",
     description="This is the REST API for Embedchain.",
     version="0.0.1",
@@ -37,12 +183,67 @@ app = FastAPI(
 )
 
 
+class RequestLatencyMiddleware:
+    """
+    Records the time spent handling each request, by route and whether an app ID was given.
+
+    Plain ASGI middleware, `BaseHTTPMiddleware` would run every request in an extra task group.
+    """
+
+    def __init__(self, app: ASGIApp, routes: list[BaseRoute]):
+        self.app = app
+        request_latency = metrics.get_request_latency()
+        # Label values are known upfront, so the children of the histogram are only created once. Only matched routes
+        # are recorded, so unknown paths don't create new label values.
+        self.histograms = {
+            (route.path, app_id_present): request_latency.labels(route.path, str(app_id_present).lower())
+            for route in routes
+            if route.path != "/metrics"
+            for app_id_present in (True, False)
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            app_id_present = bool(scope.get("path_params", {}).get("app_id")) or b"app_id=" in scope["query_string"]
+            route = scope.get("route")
+            histogram = self.histograms.get((route.path, app_id_present)) if route is not None else None
+            if histogram is not None:
+                histogram.observe(time.perf_counter() - start)
+
+
+if metrics.METRICS_ENABLED:
+    app.add_middleware(RequestLatencyMiddleware, routes=app.routes)
+
+    @app.get("/metrics", tags=["Utility"], include_in_schema=False)
+    def get_metrics():
+        """
+        Prometheus metrics of the API
+        """
+        content, media_type = metrics.generate_metrics()
+        return Response(content=content, media_type=media_type)
+
+
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError):
+    """
+    Errors raised by apps, most commonly because an API key is not set.
+    """
+    logger.warning(str(exc))
+    return JSONResponse(status_code=400, content={"detail": generate_error_message_for_api_keys(exc)})
+
+
 @app.get("/ping", tags=["Utility"])
 def check_status():
     """
     Endpoint to check the status of the API
     """
-    return {"ping": "pong"}
+    return Response(content=PONG_RESPONSE, media_type="application/json")
 
 
 @app.get("/apps", tags=["Apps"])
@@ -67,24 +268,37 @@ async def create_app_using_default_config(app_id: str, config: UploadFile = None
         if app_id is None:
             raise HTTPException(detail="App ID not provided.", status_code=400)
 
+        if not APP_ID_RE.fullmatch(app_id):
+            raise HTTPException(
+                detail="App ID can only contain letters, digits, underscores and hyphens.", status_code=400
+            )
+
         if get_app(db, app_id) is not None:
             raise HTTPException(detail=f"App with id '{app_id}' already exists.", status_code=400)
 
         yaml_path = "default.yaml"
         if config is not None:
-            contents = await config.read()
+            yaml_path = str(CONFIG_DIR / f"{app_id}.yaml")
+            # Unique temporary file, so concurrent uploads for the same app ID don't write into the same file
+            fd, tmp_path = tempfile.mkstemp(suffix=".yaml.tmp", dir=CONFIG_DIR)
+            os.close(fd)
             try:
-                yaml.safe_load(contents)
-                # TODO: validate the config yaml file here
-                yaml_path = f"configs/{app_id}.yaml"
-                async with aiofiles.open(yaml_path, mode="w") as file_out:
-                    await file_out.write(str(contents, "utf-8"))
-            except yaml.YAMLError as exc:
-                raise HTTPException(detail=f"Error parsing YAML: {exc}", status_code=400)
+                async with aiofiles.open(tmp_path, mode="wb") as file_out:
+                    while chunk := await config.read(UPLOAD_CHUNK_SIZE):
+                        await file_out.write(chunk)
+                try:
+                    # TODO: validate the config yaml file here
+                    await run_in_threadpool(_load_yaml_file, tmp_path)
+                except yaml.YAMLError as exc:
+                    raise HTTPException(detail=f"Error parsing YAML: {exc}", status_code=400)
+                os.replace(tmp_path, yaml_path)
+            finally:
+                with suppress(FileNotFoundError):
+                    os.unlink(tmp_path)
 
         save_app(db, app_id, yaml_path)
 
-        return DefaultResponse(response=f"App created successfully. App ID: {app_id}")
+        return ORJSONResponse({"response": f"App created successfully. App ID: {app_id}"})
     except Exception as e:
         logger.warning(str(e))
         raise HTTPException(detail=f"Error creating app: {str(e)}", status_code=400)
@@ -101,26 +315,20 @@ async def get_datasources_associated_with_app_id(app_id: str, db: Session = Depe
     """
     try:
         if app_id is None:
-            raise HTTPException(
-                detail="App ID not provided. If you want to use the default app, use 'default' as the app_id.",
-                status_code=400,
-            )
+            raise HTTPException(detail=APP_ID_NOT_PROVIDED, status_code=400)
 
         db_app = get_app(db, app_id)
 
         if db_app is None:
-            raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
+            raise HTTPException(detail=APP_NOT_FOUND.format(app_id=app_id), status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        app = await run_in_threadpool(_load_app, db_app.config)
 
-        response = app.get_data_sources()
+        response = await run_in_threadpool(app.get_data_sources)
         return {"results": response}
-    except ValueError as ve:
-        logger.warning(str(ve))
-        raise HTTPException(
-            detail=generate_error_message_for_api_keys(ve),
-            status_code=400,
-        )
+    except ValueError:
+        # Handled by `value_error_handler`
+        raise
     except Exception as e:
         logger.warning(str(e))
         raise HTTPException(detail=f"Error occurred: {str(e)}", status_code=400)
@@ -140,26 +348,20 @@ async def add_datasource_to_an_app(body: SourceApp, app_id: str, db: Session = D
     """
     try:
         if app_id is None:
-            raise HTTPException(
-                detail="App ID not provided. If you want to use the default app, use 'default' as the app_id.",
-                status_code=400,
-            )
+            raise HTTPException(detail=APP_ID_NOT_PROVIDED, status_code=400)
 
         db_app = get_app(db, app_id)
 
         if db_app is None:
-            raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
+            raise HTTPException(detail=APP_NOT_FOUND.format(app_id=app_id), status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        app = await run_in_threadpool(_load_app, db_app.config)
 
-        response = app.add(source=body.source, data_type=body.data_type)
-        return DefaultResponse(response=response)
-    except ValueError as ve:
-        logger.warning(str(ve))
-        raise HTTPException(
-            detail=generate_error_message_for_api_keys(ve),
-            status_code=400,
-        )
+        response = await run_in_threadpool(app.add, source=body.source, data_type=body.data_type)
+        return ORJSONResponse({"response": response})
+    except ValueError:
+        # Handled by `value_error_handler`
+        raise
     except Exception as e:
         logger.warning(str(e))
         raise HTTPException(detail=f"Error occurred: {str(e)}", status_code=400)
@@ -178,26 +380,20 @@ async def query_an_app(body: QueryApp, app_id: str, db: Session = Depends(get_db
     """
     try:
         if app_id is None:
-            raise HTTPException(
-                detail="App ID not provided. If you want to use the default app, use 'default' as the app_id.",
-                status_code=400,
-            )
+            raise HTTPException(detail=APP_ID_NOT_PROVIDED, status_code=400)
 
         db_app = get_app(db, app_id)
 
         if db_app is None:
-            raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
+            raise HTTPException(detail=APP_NOT_FOUND.format(app_id=app_id), status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        app = await run_in_threadpool(_load_app, db_app.config)
 
-        response = app.query(body.query)
-        return DefaultResponse(response=response)
-    except ValueError as ve:
-        logger.warning(str(ve))
-        raise HTTPException(
-            detail=generate_error_message_for_api_keys(ve),
-            status_code=400,
-        )
+        response = await run_in_threadpool(app.query, body.query)
+        return ORJSONResponse({"response": response})
+    except ValueError:
+        # Handled by `value_error_handler`
+        raise
     except Exception as e:
         logger.warning(str(e))
         raise HTTPException(detail=f"Error occurred: {str(e)}", status_code=400)
@@ -217,28 +413,19 @@ async def query_an_app(body: QueryApp, app_id: str, db: Session = Depends(get_db
 #     """
 #     try:
 #         if app_id is None:
-#             raise HTTPException(
-#                 detail="App ID not provided. If you want to use the default app, use 'default' as the app_id.",
-#                 status_code=400,
-#             )
+#             raise HTTPException(detail=APP_ID_NOT_PROVIDED, status_code=400)
 
 #         db_app = get_app(db, app_id)
 
 #         if db_app is None:
-#             raise HTTPException(
-#               detail=f"App with id {app_id} does not exist, please create it first.",
-#               status_code=400
-#             )
-
-#         app = App.from_config(config_path=db_app.config)
-
-#         response = app.chat(body.message)
-#         return DefaultResponse(response=response)
-#     except ValueError as ve:
-#             raise HTTPException(
-#                 detail=generate_error_message_for_api_keys(ve),
-#                 status_code=400,
-#             )
+#             raise HTTPException(detail=APP_NOT_FOUND.format(app_id=app_id), status_code=400)
+
+#         app = await run_in_threadpool(_load_app, db_app.config)
+
+#         response = await run_in_threadpool(app.chat, body.message)
+#         return ORJSONResponse({"response": response})
+#     except ValueError:
+#         raise
 #     except Exception as e:
 #         raise HTTPException(detail=f"Error occurred: {str(e)}", status_code=400)
 
@@ -257,30 +444,24 @@ async def deploy_app(body: DeployAppRequest, app_id: str, db: Session = Depends(
     """
     try:
         if app_id is None:
-            raise HTTPException(
-                detail="App ID not provided. If you want to use the default app, use 'default' as the app_id.",
-                status_code=400,
-            )
+            raise HTTPException(detail=APP_ID_NOT_PROVIDED, status_code=400)
 
         db_app = get_app(db, app_id)
 
         if db_app is None:
-            raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
+            raise HTTPException(detail=APP_NOT_FOUND.format(app_id=app_id), status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        app = await run_in_threadpool(_load_app, db_app.config)
 
         api_key = body.api_key
         # this will save the api key in the embedchain.db
-        Client(api_key=api_key)
-
-        app.deploy()
-        return DefaultResponse(response="App deployed successfully.")
-    except ValueError as ve:
-        logger.warning(str(ve))
-        raise HTTPException(
-            detail=generate_error_message_for_api_keys(ve),
-            status_code=400,
-        )
+        await run_in_threadpool(Client, api_key=api_key)
+
+        await run_in_threadpool(app.deploy)
+        return ORJSONResponse({"response": "App deployed successfully."})
+    except ValueError:
+        # Handled by `value_error_handler`
+        raise
     except Exception as e:
         logger.warning(str(e))
         raise HTTPException(detail=f"Error occurred: {str(e)}", status_code=400)
@@ -290,31 +471,27 @@ async def deploy_app(body: DeployAppRequest, app_id: str, db: Session = Depends(
     "/{app_id}/delete",
     tags=["Apps"],
     response_model=DefaultResponse,
+    status_code=202,
 )
-async def delete_app(app_id: str, db: Session = Depends(get_db)):
+async def delete_app(app_id: str, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     """
     Delete an existing app.\n
     app_id: The ID of the app to be deleted.
     """
     try:
         if app_id is None:
-            raise HTTPException(
-                detail="App ID not provided. If you want to use the default app, use 'default' as the app_id.",
-                status_code=400,
-            )
+            raise HTTPException(detail=APP_ID_NOT_PROVIDED, status_code=400)
 
         db_app = get_app(db, app_id)
 
         if db_app is None:
-            raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
-
-        app = App.from_config(config_path=db_app.config)
+            raise HTTPException(detail=APP_NOT_FOUND.format(app_id=app_id), status_code=400)
 
-        # reset app.db
-        app.db.reset()
+        key, config = await run_in_threadpool(_read_app_config, db_app.config)
 
-        remove_app(db, app_id)
-        return DefaultResponse(response=f"App with id {app_id} deleted successfully.")
+        # The vector database is reset after the response is sent, the app is removed once that succeeded
+        background_tasks.add_task(_delete_app_data, app_id, key, config)
+        return ORJSONResponse({"response": f"App with id {app_id} is being deleted."}, status_code=202)
     except Exception as e:
         raise HTTPException(detail=f"Error occurred: {str(e)}", status_code=400)
 
@@ -322,5 +499,24 @@ async def delete_app(app_id: str, db: Session = Depends(get_db)):
 if __name__ == "__main__":
     import uvicorn
 
-    is_dev = os.getenv("DEVELOPMENT", "False")
-    uvicorn.run("main:app", host="0.0.0.0", port=8080, reload=bool(is_dev))
+    is_dev = os.getenv("DEVELOPMENT", "").lower() in ("1", "true", "yes")
+    if is_dev:
+        uvicorn.run("main:app", host="0.0.0.0", port=8080, reload=True)
+    else:
+        if metrics.METRICS_ENABLED:
+            # Workers share metrics through files in this directory, start from an empty one. `prometheus_client` is
+            # not imported yet, so the workers use it.
+            metrics_dir = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", tempfile.mkdtemp(prefix="prometheus-"))
+            os.makedirs(metrics_dir, exist_ok=True)
+            for file in Path(metrics_dir).glob("*.db"):
+                file.unlink()
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8080,
+            workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+            loop="uvloop",
+            http="httptools",
+            log_level="warning",
+            access_log=False,
+        )
@@ -0,0 +1,53 @@
+import functools
+import importlib.util
+import os
+
+# Metrics are optional, install `prometheus-client` to expose them at `/metrics`
+METRICS_ENABLED = importlib.util.find_spec("prometheus_client") is not None
+
+# The metrics are defined here and not in `main`, which is imported twice by workers when it is run as a script (as
+# `__mp_main__` and as `main`), so they are only registered once per process. `prometheus_client` is imported when the
+# metrics are first used, `PROMETHEUS_MULTIPROC_DIR` must be set before that to share metrics between workers.
+
+
+def is_multiprocess() -> bool:
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+@functools.lru_cache(maxsize=None)
+def get_request_latency():
+    """
+    Histogram of the time spent handling a request, by endpoint and whether an app ID was given.
+    """
+    from prometheus_client import Histogram
+
+    return Histogram(
+        "embedchain_api_request_duration_seconds",
+        "Time spent handling a request.",
+        ["endpoint", "app_id_present"],
+    )
+
+
+def generate_metrics() -> tuple[bytes, str]:
+    """
+    Get the metrics in the Prometheus text format, and its content type.
+    """
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+
+    if is_multiprocess():
+        # Each worker process writes its metrics to this directory, collect all of them
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead():
+    """
+    Clean up the metrics files of this worker process when it exits.
+    """
+    if is_multiprocess():
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(os.getpid())
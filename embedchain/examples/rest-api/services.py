@@ -18,8 +18,7 @@ def save_app(db: Session, app_id: str, config: str):
     return db_app
 
 
-def remove_app(db: Session, app_id: str):
-    db_app = db.query(AppModel).filter(AppModel.app_id == app_id).first()
+def remove_app(db: Session, db_app: AppModel):
     db.delete(db_app)
     db.commit()
     return db_app
@@ -1,22 +1,29 @@
-def generate_error_message_for_api_keys(error: ValueError) -> str:
-    env_mapping = {
-        "OPENAI_API_KEY": "OPENAI_API_KEY",
-        "OPENAI_API_TYPE": "OPENAI_API_TYPE",
-        "OPENAI_API_BASE": "OPENAI_API_BASE",
-        "OPENAI_API_VERSION": "OPENAI_API_VERSION",
-        "COHERE_API_KEY": "COHERE_API_KEY",
-        "TOGETHER_API_KEY": "TOGETHER_API_KEY",
-        "ANTHROPIC_API_KEY": "ANTHROPIC_API_KEY",
-        "JINACHAT_API_KEY": "JINACHAT_API_KEY",
-        "HUGGINGFACE_ACCESS_TOKEN": "HUGGINGFACE_ACCESS_TOKEN",
-        "REPLICATE_API_TOKEN": "REPLICATE_API_TOKEN",
-    }
+import re
+
+# Environment variables that apps raise a `ValueError` for when they are not set
+API_KEY_ENV_VARS = (
+    "OPENAI_API_KEY",
+    "OPENAI_API_TYPE",
+    "OPENAI_API_BASE",
+    "OPENAI_API_VERSION",
+    "COHERE_API_KEY",
+    "TOGETHER_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "JINACHAT_API_KEY",
+    "HUGGINGFACE_ACCESS_TOKEN",
+    "REPLICATE_API_TOKEN",
+)
+# Finds all of the above in a single pass over the error message
+_MISSING_KEY_RE = re.compile("|".join(map(re.escape, API_KEY_ENV_VARS)))
 
-    missing_keys = [env_mapping[key] for key in env_mapping if key in str(error)]
+
+def generate_error_message_for_api_keys(error: ValueError) -> str:
+    error_message = str(error)
+    missing_keys = list(dict.fromkeys(_MISSING_KEY_RE.findall(error_message)))
     if missing_keys:
         missing_keys_str = ", ".join(missing_keys)
         return f"""Please set the {missing_keys_str} environment variable(s) when running the Docker container.
 Example: `docker run -e {missing_keys[0]}=xxx embedchain/rest-api:latest`
 """
     else:
-        return "Error: " + str(error)
+        return "Error: " + error_message
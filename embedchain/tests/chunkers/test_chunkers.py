@@ -64,3 +64,35 @@ def test_custom_config_values():
         assert chunker.text_splitter._chunk_size == 500
         assert chunker.text_splitter._chunk_overlap == 0
         assert chunker.text_splitter._length_function == len
+
+
+def test_json_chunker():
+    config = ChunkerConfig(chunk_size=20, chunk_overlap=0, length_function=len)
+    chunker = JSONChunker(config=config)
+    assert chunker.text_splitter is JSONChunker(config=config).text_splitter
+
+    text = '{"name":"embedchain","type":"rag","lang":"python"}'
+    chunks = chunker.get_chunks(text)
+    assert all(len(chunk) <= 20 for chunk in chunks)
+    assert "".join(chunks) == text
+
+
+def test_json_chunker_parallel(monkeypatch):
+    monkeypatch.setattr("embedchain.chunkers.json.PARALLEL_CHUNKING_THRESHOLD", 1000)
+    monkeypatch.setattr("embedchain.chunkers.json.PARALLEL_SEGMENT_SIZE", 500)
+    chunker = JSONChunker(config=ChunkerConfig(chunk_size=100, chunk_overlap=0, length_function=len, parallel=True))
+
+    text = "\n".join(f'{{"id":{i},"name":"item {i}"}}' for i in range(200))
+    chunks = chunker.get_chunks(text)
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert "".join(chunks).replace("\n", "") == text.replace("\n", "")
+
+
+def test_json_chunker_is_serial_by_default(monkeypatch, mocker):
+    monkeypatch.setattr("embedchain.chunkers.json.PARALLEL_CHUNKING_THRESHOLD", 10)
+    executor = mocker.patch("embedchain.chunkers.json.concurrent.futures.ProcessPoolExecutor")
+    chunker = JSONChunker(config=ChunkerConfig(chunk_size=20, chunk_overlap=0, length_function=len))
+
+    text = '{"name":"embedchain","type":"rag","lang":"python"}'
+    assert "".join(chunker.get_chunks(text)) == text
+    executor.assert_not_called()
@@ -4,6 +4,8 @@ import pytest
 from sqlalchemy import MetaData, create_engine
 from sqlalchemy.orm import sessionmaker
 
+from embedchain.utils.misc import clear_model_cache
+
 
 @pytest.fixture(autouse=True)
 def clean_db():
@@ -33,3 +35,11 @@ def disable_telemetry():
     os.environ["EC_TELEMETRY"] = "false"
     yield
     del os.environ["EC_TELEMETRY"]
+
+
+@pytest.fixture(autouse=True)
+def clean_model_cache():
+    # Tests patch model classes, don't let the mocks leak into other tests through the cache
+    clear_model_cache()
+    yield
+    clear_model_cache()
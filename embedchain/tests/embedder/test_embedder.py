@@ -47,3 +47,20 @@ def test_set_vector_dimension_type_error(base_embedder):
 def test_embedder_with_config():
     embedder = BaseEmbedder(BaseEmbedderConfig())
     assert isinstance(embedder.config, BaseEmbedderConfig)
+
+
+def test_embed_query_is_cached(base_embedder):
+    calls = []
+
+    def embedding_function(texts: Documents) -> Embeddings:
+        calls.append(texts)
+        return [[0.1, 0.2] for _ in texts]
+
+    base_embedder.set_embedding_fn(embedding_function)
+    assert base_embedder.embed_query("query") == [0.1, 0.2]
+    assert base_embedder.embed_query("query") == [0.1, 0.2]
+    assert calls == [["query"]]
+
+    cache_info = base_embedder.query_cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
@@ -12,7 +12,46 @@ def test_huggingface_embedder_with_model(monkeypatch):
         assert embedder.config.model_kwargs == {"param": "value"}
         mock_embeddings.assert_called_once_with(
             model_name="test-model",
-            model_kwargs={"param": "value"}
+            model_kwargs={"param": "value"},
+            encode_kwargs={"batch_size": 64},
         )
 
 
+def test_huggingface_embedder_with_quantized_onnx_model():
+    config = BaseEmbedderConfig(model="test-onnx-model", model_kwargs={"quantize": True})
+    with patch("embedchain.embedder.huggingface.HuggingFaceEmbeddings") as mock_embeddings, patch(
+        "embedchain.embedder.huggingface.HuggingFaceEmbedder._export_quantized_onnx_model",
+        return_value=("/tmp/onnx/test-onnx-model", "onnx/model_qint8_avx512_vnni.onnx"),
+    ) as mock_export:
+        HuggingFaceEmbedder(config=config)
+        mock_export.assert_called_once_with("test-onnx-model", True)
+        mock_embeddings.assert_called_once_with(
+            model_name="/tmp/onnx/test-onnx-model",
+            model_kwargs={"backend": "onnx", "model_kwargs": {"file_name": "onnx/model_qint8_avx512_vnni.onnx"}},
+            encode_kwargs={"batch_size": 64},
+        )
+
+
+def test_huggingface_embedder_with_encode_kwargs():
+    config = BaseEmbedderConfig(
+        model="test-normalized-model", model_kwargs={"encode_kwargs": {"normalize_embeddings": True}}
+    )
+    with patch("embedchain.embedder.huggingface.HuggingFaceEmbeddings") as mock_embeddings:
+        HuggingFaceEmbedder(config=config)
+        mock_embeddings.assert_called_once_with(
+            model_name="test-normalized-model",
+            model_kwargs={},
+            encode_kwargs={"batch_size": 64, "normalize_embeddings": True},
+        )
+
+
+def test_huggingface_embedder_default_model():
+    with patch("embedchain.embedder.huggingface.HuggingFaceEmbeddings") as mock_embeddings:
+        embedder = HuggingFaceEmbedder()
+        assert embedder.config.model == "sentence-transformers/all-MiniLM-L6-v2"
+        assert embedder.vector_dimension == 384
+        mock_embeddings.assert_called_once_with(
+            model_name="sentence-transformers/all-MiniLM-L6-v2",
+            model_kwargs={},
+            encode_kwargs={"batch_size": 64},
+        )
@@ -59,3 +59,26 @@ def test_access_search_and_get_results(base_llm, mocker):
     input_query = "Test query"
     result = base_llm.access_search_and_get_results(input_query)
     assert result == "Search Results"
+
+
+@pytest.mark.asyncio
+async def test_aget_llm_model_answer_streams_chunks(base_llm, mocker):
+    mocker.patch.object(base_llm, "get_llm_model_answer", return_value=iter(["Hello", " world"]))
+
+    chunks = [chunk async for chunk in base_llm.aget_llm_model_answer("prompt")]
+    assert chunks == ["Hello", " world"]
+
+
+@pytest.mark.asyncio
+async def test_aget_llm_model_answer_raises_llm_errors(base_llm, mocker):
+    def answer():
+        yield "Hello"
+        raise ValueError("LLM error")
+
+    mocker.patch.object(base_llm, "get_llm_model_answer", return_value=answer())
+
+    chunks = []
+    with pytest.raises(ValueError, match="LLM error"):
+        async for chunk in base_llm.aget_llm_model_answer("prompt"):
+            chunks.append(chunk)
+    assert chunks == ["Hello"]
@@ -1,3 +1,7 @@
+import sys
+from types import SimpleNamespace
+from unittest.mock import Mock
+
 import pytest
 from langchain_community.llms.gpt4all import GPT4All as LangchainGPT4All
 
@@ -18,6 +22,23 @@ def config():
     yield config
 
 
+class StubGPT4AllClient:
+    model_type = "llama"
+
+    def __init__(self, model_name, model_path=None, model_type=None, allow_download=False, device=None):
+        self.model_name = model_name
+        self.model = Mock()
+
+    def generate(self, prompt, streaming=False, **kwargs):
+        tokens = ["Test", " answer"]
+        return iter(tokens) if streaming else "".join(tokens)
+
+
+@pytest.fixture
+def stub_gpt4all_client(mocker):
+    mocker.patch.dict(sys.modules, {"gpt4all": SimpleNamespace(GPT4All=StubGPT4AllClient)})
+
+
 @pytest.fixture
 def gpt4all_with_config(config):
     return GPT4ALLLlm(config=config)
@@ -58,3 +79,61 @@ def test_get_llm_model_answer(mocker, gpt4all_with_config):
 def test_gpt4all_model_switching(gpt4all_with_config):
     with pytest.raises(RuntimeError, match="GPT4ALLLlm does not support switching models at runtime."):
         gpt4all_with_config._get_answer("Test prompt", BaseLlmConfig(model="new_model"))
+
+
+def test_gpt4all_resolve_model_quantization(mocker):
+    mocker.patch("embedchain.llm.gpt4all.GPT4ALLLlm._is_model_available", return_value=True)
+    assert GPT4ALLLlm._resolve_model("orca-mini-3b-gguf2-q4_0.gguf") == "orca-mini-3b-gguf2-q4_0.gguf"
+    assert GPT4ALLLlm._resolve_model("orca-mini-3b-gguf2-q4_0.gguf", "q8_0") == "orca-mini-3b-gguf2-q8_0.gguf"
+    model = GPT4ALLLlm._resolve_model("mistral-7b-instruct-v0.1.Q4_0.gguf", "q4_k_m")
+    assert model == "mistral-7b-instruct-v0.1.Q4_K_M.gguf"
+
+    with pytest.raises(ValueError, match="Invalid quantization"):
+        GPT4ALLLlm._resolve_model("orca-mini-3b-gguf2-q4_0.gguf", "q2")
+
+
+def test_gpt4all_resolve_model_missing_quantization(mocker):
+    mocker.patch("embedchain.llm.gpt4all.GPT4ALLLlm._is_model_available", return_value=False)
+
+    with pytest.raises(ValueError, match="does not exist"):
+        GPT4ALLLlm._resolve_model("orca-mini-3b-gguf2-q4_0.gguf", "f16")
+    # Models that are used as is are not checked
+    assert GPT4ALLLlm._resolve_model("orca-mini-3b-gguf2-q4_0.gguf", "q4_0") == "orca-mini-3b-gguf2-q4_0.gguf"
+
+
+def test_gpt4all_is_model_available(tmp_path):
+    model_path = tmp_path / "orca-mini-3b-gguf2-q8_0.gguf"
+    assert not GPT4ALLLlm._is_model_available(str(model_path))
+    model_path.touch()
+    assert GPT4ALLLlm._is_model_available(str(model_path))
+
+
+def test_gpt4all_stream_answer(gpt4all_with_config, mocker):
+    def generate(prompts, callbacks, **kwargs):
+        for token in ["Test", " answer"]:
+            callbacks[0].on_llm_new_token(token)
+
+    mocker.patch.object(gpt4all_with_config.instance, "generate", side_effect=generate)
+    config = BaseLlmConfig(stream=True, model=gpt4all_with_config.config.model)
+
+    assert list(gpt4all_with_config._get_answer("Test prompt", config)) == ["Test", " answer"]
+
+
+def test_gpt4all_instances_share_generate_lock(config, stub_gpt4all_client):
+    # Instances share the loaded model, generation on it must be serialized
+    first = GPT4ALLLlm(config=config)
+    second = GPT4ALLLlm(config=config)
+
+    assert first.instance is second.instance
+    assert first._generate_lock is second._generate_lock
+
+
+def test_gpt4all_generate_with_model_client(stub_gpt4all_client):
+    # Runs langchain's generate on the shared instance, the tests above mock it
+    config = BaseLlmConfig(model="orca-mini-3b-gguf2-q4_0.gguf")
+    llm = GPT4ALLLlm(config=config)
+    streaming_llm = GPT4ALLLlm(config=BaseLlmConfig(model=config.model, stream=True))
+
+    assert streaming_llm.instance is llm.instance
+    assert llm.get_llm_model_answer("Test prompt") == "Test answer"
+    assert list(streaming_llm.get_llm_model_answer("Test prompt")) == ["Test", " answer"]
@@ -77,3 +77,17 @@ def test_query_with_where_in_query_config(app):
     assert "app_id" in where
     assert "attribute" in where
     mock_answer.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("chromadb.api.models.Collection.Collection.add", MagicMock)
+async def test_aquery_streams_answer(app):
+    with patch.object(app, "_retrieve_from_database") as mock_retrieve:
+        mock_retrieve.return_value = ["Test context"]
+        with patch.object(app.llm, "get_llm_model_answer") as mock_answer:
+            mock_answer.return_value = (chunk for chunk in ["Test", " answer"])
+            answer = await app.aquery(input_query="Test query", citations=True)
+
+    chunks, contexts = answer
+    assert [chunk async for chunk in chunks] == ["Test", " answer"]
+    assert contexts == ["Test context"]
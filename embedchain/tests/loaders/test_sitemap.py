@@ -0,0 +1,82 @@
+import hashlib
+import io
+import time
+
+import pytest
+
+from embedchain.loaders.sitemap import SitemapLoader
+
+SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+    <url>
+        <loc>https://example.com/a</loc>
+        <image:image><image:loc>https://example.com/a.png</image:loc></image:image>
+    </url>
+    <url><loc>https://example.com/b</loc></url>
+    <url><loc>https://example.com/a</loc></url>
+    <url><loc>https://example.com/c.pdf</loc></url>
+    <url><loc>https://example.com/d</loc></url>
+</urlset>
+"""
+
+SITEMAP_INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <sitemap><loc>https://example.com/sitemap-1.xml</loc></sitemap>
+    <sitemap><loc>https://example.com/sitemap-2.xml</loc></sitemap>
+</sitemapindex>
+"""
+
+
+@pytest.fixture
+def sitemap_file(tmp_path):
+    path = tmp_path / "sitemap.xml"
+    path.write_text(SITEMAP)
+    return str(path)
+
+
+def test_parse_links_only_returns_page_urls():
+    links = SitemapLoader._parse_links(io.BytesIO(SITEMAP.encode()))
+
+    assert links == [
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/a",
+        "https://example.com/c.pdf",
+        "https://example.com/d",
+    ]
+
+
+def test_parse_links_falls_back_to_all_locs_for_sitemap_index():
+    links = SitemapLoader._parse_links(io.BytesIO(SITEMAP_INDEX.encode()))
+
+    assert links == ["https://example.com/sitemap-1.xml", "https://example.com/sitemap-2.xml"]
+
+
+def test_parse_links_returns_no_links_for_html():
+    assert SitemapLoader._parse_links(io.BytesIO(b"<html><body>Not found</body></html>")) == []
+    assert SitemapLoader._parse_links(io.BytesIO(b"")) == []
+
+
+def test_load_data(mocker, sitemap_file):
+    delays = {"https://example.com/a": 0.2, "https://example.com/b": 0.1, "https://example.com/d": 0}
+
+    def load_page(link):
+        # Pages finish in reverse order
+        time.sleep(delays[link])
+        return {"doc_id": link, "data": [{"content": link, "meta_data": {"url": link}}]}
+
+    mock_load_page = mocker.patch("embedchain.loaders.sitemap.WebPageLoader.load_data", side_effect=load_page)
+
+    result = SitemapLoader().load_data(sitemap_file)
+
+    # Duplicates are only loaded once and files that are not web pages are skipped
+    assert sorted(call.args[0] for call in mock_load_page.call_args_list) == sorted(delays)
+    # Output follows the sitemap order
+    assert [data["content"] for data in result["data"]] == [
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/d",
+    ]
+    links = ["https://example.com/a", "https://example.com/b", "https://example.com/c.pdf", "https://example.com/d"]
+    assert result["doc_id"] == hashlib.sha256((" ".join(links) + sitemap_file).encode()).hexdigest()
@@ -1,6 +1,8 @@
+from unittest.mock import Mock
+
 import yaml
 
-from embedchain.utils.misc import validate_config
+from embedchain.utils.misc import clear_model_cache, get_cached_model, validate_config
 
 CONFIG_YAMLS = [
     "configs/anthropic.yaml",
@@ -36,3 +38,24 @@ def test_all_config_yamls():
         except Exception as e:
             print(f"Error in {config_yaml}: {e}")
             raise e
+
+
+def test_get_cached_model_loads_once():
+    loader = Mock(return_value=object())
+
+    first = get_cached_model(("test", "model"), loader)
+    second = get_cached_model(("test", "model"), loader)
+
+    assert first is second
+    loader.assert_called_once()
+
+
+def test_clear_model_cache():
+    loader = Mock(side_effect=lambda: object())
+
+    first = get_cached_model(("test", "model"), loader)
+    clear_model_cache()
+    second = get_cached_model(("test", "model"), loader)
+
+    assert first is not second
+    assert loader.call_count == 2
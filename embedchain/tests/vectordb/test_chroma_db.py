@@ -90,6 +90,28 @@ def test_app_init_with_host_and_port_none(mock_client):
     assert called_settings.chroma_server_http_port is None
 
 
+@patch("embedchain.vectordb.chroma.chromadb.Client")
+def test_chroma_db_collection_hnsw_metadata(mock_client):
+    db = ChromaDB(config=ChromaDbConfig(allow_reset=True, dir="test-db", hnsw_search_ef=50, hnsw_num_threads=2))
+    _app = App(config=AppConfig(collect_metrics=False), db=db)
+
+    metadata = mock_client.return_value.get_or_create_collection.call_args.kwargs["metadata"]
+    assert metadata == {"hnsw:construction_ef": 200, "hnsw:search_ef": 50, "hnsw:M": 16, "hnsw:num_threads": 2}
+
+
+def test_chroma_db_existing_collection_keeps_metadata():
+    db = ChromaDB(config=ChromaDbConfig(allow_reset=True, dir="test-db", hnsw_m=32))
+    app = App(config=AppConfig(collect_metrics=False), db=db)
+    app.db.client.create_collection("existing_collection", metadata={"hnsw:space": "ip", "user": "value"})
+
+    app.set_collection_name("existing_collection")
+
+    assert app.db.collection.metadata == {"hnsw:space": "ip", "user": "value"}
+
+    # cleanup
+    app.db.reset()
+
+
 def test_chroma_db_duplicates_throw_warning(caplog):
     db = ChromaDB(config=ChromaDbConfig(allow_reset=True, dir="test-db"))
     app = App(config=AppConfig(collect_metrics=False), db=db)
@@ -251,3 +273,19 @@ def test_chroma_db_collection_reset():
     app2.db.reset()
     app3.db.reset()
     app4.db.reset()
+
+
+def test_chroma_db_query_reuses_query_embeddings():
+    db = ChromaDB(config=ChromaDbConfig(allow_reset=True, dir="test-db"))
+    app = App(config=AppConfig(collect_metrics=False), db=db)
+    app.set_collection_name("query_collection")
+    app.db.collection.add(embeddings=[[0, 0, 1]], documents=["document"], metadatas=[{"url": "url"}], ids=["1"])
+
+    with patch.object(app.db.embedder, "embedding_fn", return_value=[[0, 0, 1]]) as mock_embedding_fn:
+        assert app.db.query("query", n_results=1) == ["document"]
+        assert app.db.query("query", n_results=1) == ["document"]
+
+    mock_embedding_fn.assert_called_once_with(["query"])
+
+    # cleanup
+    app.db.reset()
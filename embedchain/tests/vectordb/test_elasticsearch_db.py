@@ -1,11 +1,14 @@
 import os
+import types
 import unittest
 from unittest.mock import patch
 
+import numpy as np
+
 from embedchain import App
 from embedchain.config import AppConfig, ElasticsearchDBConfig
 from embedchain.embedder.gpt4all import GPT4AllEmbedder
-from embedchain.vectordb.elasticsearch import ElasticsearchDB
+from embedchain.vectordb.elasticsearch import ElasticsearchDB, OrjsonSerializer
 
 
 class TestEsDB(unittest.TestCase):
@@ -65,11 +68,90 @@ class TestEsDB(unittest.TestCase):
 
         results_with_citations = self.db.query(query, n_results=2, where={}, citations=True)
         expected_results_with_citations = [
-            ("This is a document.", {"url": "url_1", "doc_id": "doc_id_1", "score": 0.9}),
-            ("This is another document.", {"url": "url_2", "doc_id": "doc_id_2", "score": 0.8}),
+            # kNN scores are scaled to the `cosine + 1` range of script_score
+            ("This is a document.", {"url": "url_1", "doc_id": "doc_id_1", "score": 1.8}),
+            ("This is another document.", {"url": "url_2", "doc_id": "doc_id_2", "score": 1.6}),
         ]
         self.assertEqual(results_with_citations, expected_results_with_citations)
 
+    @patch("embedchain.vectordb.elasticsearch.streaming_bulk")
+    @patch("embedchain.vectordb.elasticsearch.Elasticsearch")
+    def test_add_embeds_and_streams_in_batches(self, mock_client, mock_streaming_bulk):
+        self.db = ElasticsearchDB(config=ElasticsearchDBConfig(es_url="https://localhost:9200", batch_size=2))
+        app_config = AppConfig(collect_metrics=False)
+        self.app = App(config=app_config, db=self.db, embedding_model=GPT4AllEmbedder())
+        actions = []
+
+        def consume_actions(client, actions_iter, chunk_size):
+            self.assertIsInstance(actions_iter, types.GeneratorType)
+            for action in actions_iter:
+                actions.append(action)
+                yield True, {}
+
+        mock_streaming_bulk.side_effect = consume_actions
+        documents = ["doc 1", "doc 2", "doc 3"]
+        metadatas = [{"url": "url_1"}, {"url": "url_2"}, {"url": "url_3"}]
+
+        def embed_documents(docs):
+            return [[0.1, 0.2]] * len(docs)
+
+        with patch.object(self.db.embedder, "embedding_fn", side_effect=embed_documents) as embed:
+            self.db.add(documents, metadatas, ["id_1", "id_2", "id_3"])
+
+        self.assertEqual([call.args[0] for call in embed.call_args_list], [["doc 1", "doc 2"], ["doc 3"]])
+        self.assertEqual(mock_streaming_bulk.call_args.args[0], mock_client.return_value)
+        self.assertEqual(mock_streaming_bulk.call_args.kwargs, {"chunk_size": 2})
+        self.assertEqual([action["_id"] for action in actions], ["id_1", "id_2", "id_3"])
+        expected_source = {"text": "doc 3", "metadata": {"url": "url_3"}, "embeddings": [0.1, 0.2]}
+        self.assertEqual(actions[2]["_source"], expected_source)
+        mock_client.return_value.indices.refresh.assert_called_once()
+
+    @patch("embedchain.vectordb.elasticsearch.Elasticsearch")
+    def test_query_uses_knn_search(self, mock_client):
+        self.db = ElasticsearchDB(config=ElasticsearchDBConfig(es_url="https://localhost:9200", num_candidates=50))
+        app_config = AppConfig(collect_metrics=False)
+        self.app = App(config=app_config, db=self.db, embedding_model=GPT4AllEmbedder())
+        mock_client.return_value.search.return_value = {"hits": {"hits": []}}
+
+        self.db.query("This is a document", n_results=2, where={"app_id": "test-app"})
+
+        knn = mock_client.return_value.search.call_args.kwargs["knn"]
+        self.assertEqual(knn["field"], "embeddings")
+        self.assertEqual(knn["k"], 2)
+        self.assertEqual(knn["num_candidates"], 50)
+        self.assertEqual(knn["filter"], {"bool": {"must": [{"term": {"metadata.app_id.keyword": "test-app"}}]}})
+
+    @patch("embedchain.vectordb.elasticsearch.Elasticsearch")
+    def test_query_uses_script_score_without_embeddings_mapping(self, mock_client):
+        mock_client.return_value.indices.exists.return_value = True
+        mock_client.return_value.indices.get_mapping.side_effect = lambda index: {index: {"mappings": {}}}
+        self.db = ElasticsearchDB(config=ElasticsearchDBConfig(es_url="https://localhost:9200"))
+        app_config = AppConfig(collect_metrics=False)
+        self.app = App(config=app_config, db=self.db, embedding_model=GPT4AllEmbedder())
+        mock_client.return_value.search.return_value = {
+            "hits": {"hits": [{"_source": {"text": "This is a document.", "metadata": {}}, "_score": 1.8}]}
+        }
+
+        results = self.db.query("This is a document", n_results=1, where={}, citations=True)
+
+        self.assertFalse(self.db.knn_enabled)
+        self.assertIn("script_score", mock_client.return_value.search.call_args.kwargs["query"])
+        self.assertEqual(results, [("This is a document.", {"score": 1.8})])
+
+    @patch("embedchain.vectordb.elasticsearch.Elasticsearch")
+    def test_create_index_with_int8_quantization(self, mock_client):
+        mock_client.return_value.indices.exists.return_value = False
+        self.db = ElasticsearchDB(config=ElasticsearchDBConfig(es_url="https://localhost:9200", quantization="int8"))
+        app_config = AppConfig(collect_metrics=False)
+        self.app = App(config=app_config, db=self.db, embedding_model=GPT4AllEmbedder())
+
+        mappings = mock_client.return_value.indices.create.call_args.kwargs["body"]["mappings"]
+        self.assertEqual(mappings["properties"]["embeddings"]["index_options"]["type"], "int8_hnsw")
+
+    def test_config_rejects_unsupported_quantization(self):
+        with self.assertRaises(ValueError):
+            ElasticsearchDBConfig(es_url="https://localhost:9200", quantization="int4")
+
     def test_init_without_url(self):
         # Make sure it's not loaded from env
         try:
@@ -84,3 +166,35 @@ class TestEsDB(unittest.TestCase):
         # Test if an exception is raised when an invalid es_config is provided
         with self.assertRaises(TypeError):
             ElasticsearchDB(es_config={"ES_URL": "some_url", "valid es_config": False})
+
+    @patch("embedchain.vectordb.elasticsearch.Elasticsearch")
+    def test_init_uses_orjson_serializer(self, mock_client):
+        ElasticsearchDB(config=ElasticsearchDBConfig(es_url="https://localhost:9200"))
+
+        self.assertIsInstance(mock_client.call_args.kwargs["serializer"], OrjsonSerializer)
+
+    @patch("embedchain.vectordb.elasticsearch.Elasticsearch")
+    def test_init_keeps_user_serializer(self, mock_client):
+        serializer = object()
+        ElasticsearchDB(config=ElasticsearchDBConfig(es_url="https://localhost:9200", serializer=serializer))
+
+        self.assertIs(mock_client.call_args.kwargs["serializer"], serializer)
+
+
+class TestOrjsonSerializer(unittest.TestCase):
+    def setUp(self):
+        self.serializer = OrjsonSerializer()
+
+    def test_dumps_returns_bytes(self):
+        data = {"text": "document", "embeddings": [0.5, 1.0]}
+        self.assertEqual(self.serializer.dumps(data), b'{"text":"document","embeddings":[0.5,1.0]}')
+        self.assertEqual(self.serializer.dumps({"embeddings": np.array([0.5, 1.0])}), b'{"embeddings":[0.5,1.0]}')
+
+    def test_dumps_passes_strings_through(self):
+        # Already serialized bodies are only encoded
+        self.assertEqual(self.serializer.dumps('{"text":"document"}'), b'{"text":"document"}')
+        self.assertEqual(self.serializer.dumps(b'{"text":"document"}'), b'{"text":"document"}')
+
+    def test_loads_round_trips(self):
+        data = {"text": "document", "metadata": {"url": "url_1"}, "embeddings": [0.5, 1.0]}
+        self.assertEqual(self.serializer.loads(self.serializer.dumps(data)), data)
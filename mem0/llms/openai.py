@@ -1,5 +1,6 @@
 import json
-from typing import Dict, List, Optional
+import threading
+from typing import ClassVar, Dict, List, Optional
 
 from openai import OpenAI
 
@@ -7,12 +8,30 @@ from mem0.llms.base import LLMBase
 from mem0.configs.llms.base import BaseLlmConfig
 
 class OpenAILLM(LLMBase):
+    # Client shared by all instances, so that they reuse its connection pool
+    _client: ClassVar[Optional[OpenAI]] = None
+    _client_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, config: Optional[BaseLlmConfig] = None):
         super().__init__(config)
 
         if not self.config.model:
             self.config.model="gpt-4o"
-        self.client = OpenAI()
+        self.client = self._get_client()
+
+    @classmethod
+    def _get_client(cls) -> OpenAI:
+        """
+        Get the shared OpenAI client, creating it on first use.
+
+        Returns:
+            OpenAI: The shared client.
+        """
+        if cls._client is None:
+            with cls._client_lock:
+                if cls._client is None:
+                    cls._client = OpenAI()
+        return cls._client
     
     def _parse_response(self, response, tools):
         """
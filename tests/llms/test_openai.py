@@ -1,14 +1,31 @@
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 from mem0.llms.openai import OpenAILLM
 from mem0.configs.llms.base import BaseLlmConfig
 
-@pytest.fixture
-def mock_openai_client():
+def _response(content, tool_calls=None):
+    message = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _tool_call(name, arguments):
+    return SimpleNamespace(function=SimpleNamespace(name=name, arguments=arguments))
+
+
+@pytest.fixture(scope="module")
+def shared_openai_client():
     with patch('mem0.llms.openai.OpenAI') as mock_openai:
-        mock_client = Mock()
-        mock_openai.return_value = mock_client
-        yield mock_client
+        OpenAILLM._client = None
+        yield mock_openai.return_value
+    OpenAILLM._client = None
+
+
+@pytest.fixture
+def mock_openai_client(shared_openai_client):
+    shared_openai_client.reset_mock()
+    return shared_openai_client
 
 
 def test_generate_response_without_tools(mock_openai_client):
@@ -19,9 +36,7 @@ def test_generate_response_without_tools(mock_openai_client):
         {"role": "user", "content": "Hello, how are you?"}
     ]
     
-    mock_response = Mock()
-    mock_response.choices = [Mock(message=Mock(content="I'm doing well, thank you for asking!"))]
-    mock_openai_client.chat.completions.create.return_value = mock_response
+    mock_openai_client.chat.completions.create.return_value = _response("I'm doing well, thank you for asking!")
 
     response = llm.generate_response(messages)
 
@@ -59,17 +74,10 @@ def test_generate_response_with_tools(mock_openai_client):
         }
     ]
     
-    mock_response = Mock()
-    mock_message = Mock()
-    mock_message.content = "I've added the memory for you."
-    
-    mock_tool_call = Mock()
-    mock_tool_call.function.name = "add_memory"
-    mock_tool_call.function.arguments = '{"data": "Today is a sunny day."}'
-    
-    mock_message.tool_calls = [mock_tool_call]
-    mock_response.choices = [Mock(message=mock_message)]
-    mock_openai_client.chat.completions.create.return_value = mock_response
+    mock_openai_client.chat.completions.create.return_value = _response(
+        "I've added the memory for you.",
+        tool_calls=[_tool_call("add_memory", '{"data": "Today is a sunny day."}')],
+    )
 
     response = llm.generate_response(messages, tools=tools)
 
@@ -87,4 +95,7 @@ def test_generate_response_with_tools(mock_openai_client):
     assert len(response["tool_calls"]) == 1
     assert response["tool_calls"][0]["name"] == "add_memory"
     assert response["tool_calls"][0]["arguments"] == {'data': 'Today is a sunny day.'}
-    
\ No newline at end of file
+    
+
+def test_openai_client_is_shared(mock_openai_client):
+    assert OpenAILLM().client is OpenAILLM().client is mock_openai_client